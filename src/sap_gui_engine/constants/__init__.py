@@ -1,3 +1,12 @@
 from .control_id import ControlID
-from .gui_object import GuiObject
+from .gui_object import (
+    GUI_BUTTON,
+    GUI_CHECKBOX,
+    GUI_COMBO_BOX,
+    GUI_MODAL_WINDOW,
+    GUI_RADIO_BUTTON,
+    GUI_TAB,
+    GUI_TABLE_CONTROL,
+    GuiObject,
+)
 from .vkey import VKey
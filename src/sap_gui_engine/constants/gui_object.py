@@ -1,4 +1,5 @@
 from enum import StrEnum
+from typing import Final
 
 
 class GuiObject(StrEnum):
@@ -52,3 +53,14 @@ class GuiObject(StrEnum):
     TOOL_BAR = "GuiToolbar"
     TREE = "GuiTree"
     VCOMPONENT = "GuiVComponent"
+
+
+# Plain str values of the members compared on hot paths, enum member access is comparatively slow.
+# They are the interned literals, so they also match an interned element type on identity.
+GUI_BUTTON: Final[str] = GuiObject.BUTTON.value
+GUI_TAB: Final[str] = GuiObject.TAB.value
+GUI_RADIO_BUTTON: Final[str] = GuiObject.RADIO_BUTTON.value
+GUI_CHECKBOX: Final[str] = GuiObject.CHECKBOX.value
+GUI_COMBO_BOX: Final[str] = GuiObject.COMBO_BOX.value
+GUI_MODAL_WINDOW: Final[str] = GuiObject.MODAL_WINDOW.value
+GUI_TABLE_CONTROL: Final[str] = GuiObject.TABLE_CONTROL.value
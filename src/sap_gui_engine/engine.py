@@ -1,17 +1,29 @@
 import logging
+import re
+import threading
+import traceback
 from dataclasses import dataclass
+from typing import Final
 
+import pythoncom
+import pywintypes
 import win32com.client as win32
 
 from sap_gui_engine.constants import ControlID
-from sap_gui_engine.exceptions import SAPConnectionError, SAPLoginError
+from sap_gui_engine.exceptions import (
+    SAPConnectionError,
+    SAPElementNotFound,
+    SAPLoginError,
+)
 from sap_gui_engine.objects import GuiSession
-from sap_gui_engine.utils import launch_application
+from sap_gui_engine.utils import as_stripped_str, launch_application
 
 logger = logging.getLogger(__name__)
 
+_MULTI_LOGON_RE = re.compile(r"already logged on", re.IGNORECASE)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SAPLoginScreenElements:
     client: str = "wnd[0]/usr/txtRSYST-MANDT"
     username: str = "wnd[0]/usr/txtRSYST-BNAME"
@@ -19,6 +31,9 @@ class SAPLoginScreenElements:
     language: str = "wnd[0]/usr/txtRSYST-LANGU"
 
 
+_DEFAULT_LOGIN_ELEMENTS: Final = SAPLoginScreenElements()
+
+
 class SAPGuiEngine:
     def __init__(
         self,
@@ -30,6 +45,7 @@ class SAPGuiEngine:
         language: str | None = None,
         executable_path: str = r"C:\Program Files\SAP\FrontEnd\SAPGUI\saplogon.exe",
         window_title_re: str = "SAP Logon 800",
+        cache_elements: bool = False,
     ):
         """Initialize SAPGuiEngine with connection parameters.
 
@@ -51,6 +67,10 @@ class SAPGuiEngine:
             Path to SAP Logon executable, by default r"C:\\Program Files\\SAP\\FrontEnd\\SAPGUI\\saplogon.exe"
         window_title_re : str, optional
             Regular expression for SAP Logon window title, by default "SAP Logon 800"
+        cache_elements : bool, optional
+            Whether the session caches find_by_id results and the status bar message
+            until the next action of this library that can change the screen, by default
+            False. See GuiSession.clear_cache for screen changes made on the COM objects.
         """
         self.connection_name = connection_name
         self.username = username
@@ -60,11 +80,14 @@ class SAPGuiEngine:
         self.language = language
         self.executable_path = executable_path
         self.window_title_re = window_title_re
+        self.cache_elements = cache_elements
 
         self._sap_gui_auto = None
         self._app = None
         self._com_connection = None
         self._session: GuiSession = None
+        # Ident of the worker thread this engine called CoInitialize on, if any
+        self._com_initialized_thread: int | None = None
 
     def __enter__(self):
         """
@@ -77,8 +100,11 @@ class SAPGuiEngine:
         """
         Teardown to cleanup the resources.
         """
-        if self._session:
-            self._session.close()
+        try:
+            if self._session:
+                self._session.close()
+        finally:
+            self._release_com()
 
     def open_connection(self) -> GuiSession:
         """Open a connection to the SAP system.
@@ -103,8 +129,29 @@ class SAPGuiEngine:
             If login fails.
         TimeoutError
             If SAP Logon application fails to launch within timeout, default = 60 seconds.
+
+        Notes
+        -----
+        SAP GUI COM objects live in a single-threaded apartment. When called from a
+        thread other than the main thread, COM is initialized for that thread and
+        uninitialized again in close_connection, when leaving the context manager or
+        when opening the connection fails. Use one SAPGuiEngine per thread and do not
+        share the returned GuiSession across threads.
         """
 
+        # The caller gets no engine state to clean up when this fails, so the COM
+        # references and the CoInitialize of a worker thread are released here
+        try:
+            return self._open_connection()
+        except Exception as e:
+            # The traceback keeps the failed frames and the COM proxies in their locals
+            # alive, clear them so CoUninitialize does not run while they are referenced
+            traceback.clear_frames(e.__traceback__)
+            self._release_com()
+            raise
+
+    def _open_connection(self) -> GuiSession:
+        """Connect to the scripting engine and attach to or open the user's connection."""
         # Launch SAP Logon application if not already running, and connect to scripting engine
         self._connect_to_engine()
         if not self._app:
@@ -126,7 +173,11 @@ class SAPGuiEngine:
 
             # Connection is already open, so attach to the first session
             logger.info(f"Attaching to first session for user: {self.username}")
-            session = GuiSession(existing_connection.Children(0))
+            self._com_connection = existing_connection
+            session = GuiSession(
+                existing_connection.Children(0), cache_elements=self.cache_elements
+            )
+            self._session = session
             self._login(session)
             return session
 
@@ -146,8 +197,7 @@ class SAPGuiEngine:
         except Exception as e:
             logger.error(f"Error while closing connection: {e}")
         finally:
-            self._app = None
-            self._sap_gui_auto = None
+            self._release_com()
 
     def _is_connection_open(self):
         """Check if a connection for the specified user is already open.
@@ -163,24 +213,25 @@ class SAPGuiEngine:
         """
         logger.info(f"Checking for existing connection for user: {self.username}")
 
-        children_count = self._app.Children.Count
+        # Resolve the collection once, every .Children access is a COM call
+        connections = self._app.Children
+        children_count = connections.Count
         if children_count == 0:
             return None
 
+        target = self.connection_name.strip().casefold()
         for i in range(children_count):
-            conn = self._app.Children(i)
-            if (
-                str(conn.Description).strip().lower()
-                != str(self.connection_name).strip().lower()
-            ):
+            conn = connections(i)
+            if conn.Description.strip().casefold() != target:
                 continue
 
-            session_count = conn.Children.Count
+            sessions = conn.Children
+            session_count = sessions.Count
             if session_count == 0:
                 return conn
             # Session count is greater than 0, so check if any of the sessions are logged in as the given user
-            for j in range(conn.Children.Count):
-                session = conn.Children(j)
+            for j in range(session_count):
+                session = sessions(j)
                 if session.Info.User == self.username:
                     return conn
 
@@ -189,13 +240,18 @@ class SAPGuiEngine:
     def _create_new_connection(self) -> GuiSession:
         logger.info(f"Creating new connection for user: {self.username}")
         connection = self._app.OpenConnection(self.connection_name, True)
-        session = GuiSession(connection.Children(0))
+        self._com_connection = connection
+        session = GuiSession(
+            connection.Children(0), cache_elements=self.cache_elements
+        )
+        self._session = session
         self._login(session)
         return session
 
     def _login(
         self,
         session: GuiSession,
+        elements: SAPLoginScreenElements = _DEFAULT_LOGIN_ELEMENTS,
     ) -> bool:
         """Perform SAP login with provided credentials.
 
@@ -208,6 +264,8 @@ class SAPGuiEngine:
         ----------
         session : GuiSession
             The GuiSession object to perform login on
+        elements : SAPLoginScreenElements, optional
+            IDs of the login screen fields, by default the standard SAP login screen
 
         Returns
         -------
@@ -219,23 +277,28 @@ class SAPGuiEngine:
         SAPLoginError
             If login fails
         """
-        user_field = session.find_by_id(
-            SAPLoginScreenElements.username,
-            raise_error=False,
-        )
-        if not user_field:
+        # The login fields are plain text fields, so they are set directly on the COM
+        # objects instead of through GuiVComponent, which would read Changeable, Type
+        # and MaxLength of every field first. The values are stripped like set_text does.
+        com_session = session.session
+        user_field = com_session.FindById(elements.username, False)
+        if user_field is None:
             logger.info("Login screen not found. Assuming user is already logged in.")
             return True
 
         logger.info(f"Logging in as {self.username}...")
-        user_field.text = self.username
-        session.find_by_id(SAPLoginScreenElements.password).text = self.password
-
+        login_fields = [(elements.password, self.password)]
         if self.client:
-            session.find_by_id(SAPLoginScreenElements.client).text = self.client
-
+            login_fields.append((elements.client, self.client))
         if self.language:
-            session.find_by_id(SAPLoginScreenElements.language).text = self.language
+            login_fields.append((elements.language, self.language))
+
+        user_field.Text = as_stripped_str(self.username)
+        for field_id, value in login_fields:
+            field = com_session.FindById(field_id, False)
+            if field is None:
+                raise SAPElementNotFound(f"The element with ID: {field_id} not found")
+            field.Text = as_stripped_str(value)
 
         session.press_enter()
 
@@ -246,18 +309,18 @@ class SAPGuiEngine:
         )
 
         # Handle multi-logon
-        if status.text and "already logged on" in status.text.lower():
+        if status.text and _MULTI_LOGON_RE.search(status.text):
             logger.info("Multi-logon detected.")
             if not self.terminate_other_sessions:
                 raise SAPLoginError("User already logged on in some other session.")
 
             logger.info("Terminating other sessions...")
             try:
-                rb = session.find_by_id(
-                    ControlID.TERMINATE_OTHER_SESSIONS_RADIO, raise_error=False
+                rb = com_session.FindById(
+                    ControlID.TERMINATE_OTHER_SESSIONS_RADIO, False
                 )
-                if rb:
-                    rb.select()
+                if rb is not None:
+                    rb.Select()
 
                 session.press_enter(1)
             except Exception as e:
@@ -273,8 +336,9 @@ class SAPGuiEngine:
     def _connect_to_engine(self):
         """Establish connection to the SAP GUI scripting engine.
 
-        This method establishes connection to the SAP GUI scripting engine
-        by launching the SAP Logon application and connecting to the COM object.
+        This method first tries to attach to the scripting engine of an already
+        running SAP Logon application. Only if that fails, it launches the SAP Logon
+        application and connects to the COM object.
 
         Raises
         ------
@@ -284,12 +348,71 @@ class SAPGuiEngine:
         TimeoutError
             If SAP logon failed to launch within the specified timeout period, default 60 seconds
         """
+        self._initialize_com()
+
+        # SAP Logon is usually already running, attaching first skips the process check and launch
+        try:
+            self._attach_to_engine()
+            return
+        except pywintypes.com_error:
+            logger.info("SAP GUI scripting engine not available, launching SAP Logon")
+        except Exception as e:
+            raise SAPConnectionError(
+                f"Could not connect to SAP GUI scripting engine: {e}"
+            ) from e
+
         launch_application(self.executable_path, self.window_title_re)
 
         try:
-            self._sap_gui_auto = win32.GetObject("SAPGUI")
-            self._app = self._sap_gui_auto.GetScriptingEngine
+            self._attach_to_engine()
         except Exception as e:
             raise SAPConnectionError(
                 f"Could not connect to SAP GUI scripting engine: {e}"
             ) from e
+
+    def _attach_to_engine(self):
+        """Attach to the scripting engine of the running SAP Logon application.
+
+        Raises
+        ------
+        pywintypes.com_error
+            If SAP Logon is not running or scripting is not available
+        """
+        self._sap_gui_auto = win32.GetObject("SAPGUI")
+        self._app = self._sap_gui_auto.GetScriptingEngine
+
+    def _initialize_com(self):
+        """Initialize COM for the current thread if it is not the main thread.
+
+        The main thread is already initialized by pywin32 on import, worker threads
+        (task runners, notebook kernels, etc.) are not.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return
+        if self._com_initialized_thread == threading.get_ident():
+            return
+
+        pythoncom.CoInitialize()
+        self._com_initialized_thread = threading.get_ident()
+
+    def _release_com(self):
+        """Drop all references to SAP GUI COM objects, then balance _initialize_com.
+
+        CoUninitialize must not run while proxies of the thread are still alive, so
+        the session (and the components it has cached) is released first.
+        """
+        if self._session is not None:
+            self._session.release()
+        self._session = None
+        self._com_connection = None
+        self._app = None
+        self._sap_gui_auto = None
+        self._uninitialize_com()
+
+    def _uninitialize_com(self):
+        """Balance the CoInitialize call made by _initialize_com, on the same thread."""
+        if self._com_initialized_thread != threading.get_ident():
+            return
+
+        pythoncom.CoUninitialize()
+        self._com_initialized_thread = None
@@ -0,0 +1,41 @@
+from typing import Any
+
+
+class ComWrapper:
+    """
+    Mixin for the wrappers around SAP GUI COM objects.
+
+    Attributes that are not defined on the wrapper are read from and written to the
+    wrapped COM object, which is stored in the attribute named by _com_attr. The
+    wrappers do not hold ad-hoc Python attributes, assigning one the COM object does
+    not accept raises AttributeError.
+    """
+
+    __slots__ = ()
+
+    _com_attr: str = "_com_element"
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate attribute access to the underlying COM object."""
+        # Private and dunder names are never COM properties (copy/pickle/hasattr probes),
+        # fail fast instead of paying a COM round trip that can only fail
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(getattr(self, self._com_attr), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set private attributes and attributes defined on the class on this instance, delegate everything else to the underlying COM object.
+        """
+        # Internal attributes never exist on the COM object, so they skip the COM hasattr probe
+        if name.startswith("_") or hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+            return
+
+        try:
+            setattr(getattr(self, self._com_attr), name, value)
+        except Exception as e:
+            raise AttributeError(
+                f"Cannot set '{name}' on {type(self).__name__}: it is not an attribute of "
+                f"the wrapper and the wrapped COM object rejected it ({e})"
+            ) from e
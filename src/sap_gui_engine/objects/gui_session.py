@@ -1,13 +1,21 @@
 import logging
-from typing import Optional, Type, overload
-
-from sap_gui_engine.constants import ControlID, GuiObject, VKey
+import re
+from typing import Any, Final, Optional, Type, overload
+
+from sap_gui_engine.constants import (
+    GUI_MODAL_WINDOW,
+    GUI_TABLE_CONTROL,
+    ControlID,
+    VKey,
+)
 from sap_gui_engine.exceptions import (
     SAPElementNotFound,
     SAPStatusBarError,
     SAPTransactionError,
 )
+from sap_gui_engine.utils import as_stripped_str
 
+from .com_wrapper import ComWrapper
 from .gui_table_control import GuiTableControl
 from .gui_vcomponent import GuiVComponent
 from .session_info import SessionInfo
@@ -15,40 +23,49 @@ from .statusbar_msg import StatusbarMsg
 
 logger = logging.getLogger(__name__)
 
+_TCODE_NOT_FOUND_RE = re.compile(r"does not exist", re.IGNORECASE)
+
+# SAP GUI allows at most a handful of windows per session, their IDs are formatted once
+_WND_IDS: Final[tuple[str, ...]] = tuple(f"wnd[{i}]" for i in range(10))
+
+
+def _window_id(window_index: int) -> str:
+    """Returns the ID of the window at window_index, e.g. wnd[1]."""
+    if 0 <= window_index < len(_WND_IDS):
+        return _WND_IDS[window_index]
+    return f"wnd[{window_index}]"
+
 
-class GuiSession:
+class GuiSession(ComWrapper):
     """
     A wrapper class for SAP GUI COM Session objects that provides convenient methods
     for common operations while delegating unknown attributes and methods to the
     underlying COM session object.
 
     This class implements attribute delegation, meaning that if a requested attribute
-    or method is not found in this class, it will be looked up in the underlying
-    _com_session object. Methods defined in this class take precedence over those
-    in the _com_session object.
+    or method is not found in this class, it will be read from or written to the
+    underlying _com_session object. Methods defined in this class take precedence over
+    those in the _com_session object.
     """
 
-    def __init__(self, com_session):
-        self._com_session = com_session
+    _com_attr = "_com_session"
 
-    def __getattr__(self, name):
-        """
-        Delegate attribute access to the underlying _com_session object.
+    def __init__(self, com_session, cache_elements: bool = False):
         """
-        return getattr(self._com_session, name)
-
-    def __setattr__(self, name, value):
-        """
-        Set attributes on this class instance or delegate to the underlying _com_element if the attribute does not exist on the class instnace.
+        Parameters
+        ----------
+        com_session : CDispatch
+            The SAP GUI COM session object to wrap
+        cache_elements : bool, optional
+            If True, find_by_id and get_statusbar_msg reuse their results until the next
+            action of this library that can change the screen, by default False.
+            Screen changes triggered directly on the COM objects are not detected, so
+            clear_cache must be called after them.
         """
-        try:
-            element = object.__getattribute__(self, "_com_element")
-            if hasattr(element, name):
-                setattr(element, name, value)
-        except AttributeError:
-            # Fallback
-            pass
-        object.__setattr__(self, name, value)
+        self._com_session = com_session
+        self._cache_elements = cache_elements
+        self._find_cache: dict[str, GuiVComponent | GuiTableControl] = {}
+        self._statusbar_msg: StatusbarMsg | None = None
 
     @property
     def session(self):
@@ -60,6 +77,7 @@ class GuiSession:
         Closes the current session.
         """
         self._com_session.SendCommand("/i")
+        self.clear_cache()
         # If this is not the last session, the session closes here immediately and _com_session object becomes unknown, so find_by_id will throw an
         try:
             # Sometimes the confirmation dialog may be in wnd[1], wnd[2] and so on.
@@ -78,6 +96,28 @@ class GuiSession:
             pass
         return
 
+    def release(self) -> None:
+        """
+        Releases the underlying COM session and all cached components.
+
+        The session can not be used afterwards. Called by SAPGuiEngine before COM is
+        uninitialized for the thread.
+        """
+        self.clear_cache()
+        self._com_session = None
+
+    def clear_cache(self) -> None:
+        """
+        Clears the cache of elements resolved by find_by_id and the last status bar message.
+
+        Only used when the session was created with cache_elements=True. The cache is
+        cleared automatically after every action of this library that can change the
+        screen. Call this after triggering a screen change directly on the underlying
+        COM objects, e.g. session.SendCommand or element.Press().
+        """
+        self._find_cache.clear()
+        self._statusbar_msg = None
+
     @overload
     def find_by_id(
         self, id: str, raise_error: bool = True
@@ -96,6 +136,10 @@ class GuiSession:
         """
         Finds a GUI component by its SAP ID
 
+        If the session was created with cache_elements=True, found components are
+        cached per ID until the next action of this library that can change the screen,
+        so repeated lookups on the same screen skip the COM call.
+
         Parameters
         ----------
         id : str
@@ -113,17 +157,59 @@ class GuiSession:
         SAPElementNotFound
             If the element is not found and raise_error is True
         """
-        element = self._com_session.findById(id, False)  # False = don't raise com error
+        if self._cache_elements:
+            cached = self._find_cache.get(id)
+            if cached is not None:
+                return cached
+
+        element = self._com_session.FindById(id, False)  # False = don't raise com error
 
         if element is None:
             if raise_error:
                 raise SAPElementNotFound(f"The element with ID: {id} not found")
             return None
 
-        if element.Type == GuiObject.TABLE_CONTROL:
-            return GuiTableControl(element, id, self)
+        # The wrapper reads and caches Type, nothing else is fetched until it is used
+        component = GuiVComponent(element, self)
+        element_type = component.type
+        if element_type == GUI_TABLE_CONTROL:
+            component = GuiTableControl(element, id, self, element_type)
+
+        if self._cache_elements:
+            self._find_cache[id] = component
+        return component
+
+    def set_texts(self, values: dict[str, Any], raise_error: bool = True) -> bool:
+        """
+        Sets the text or selects a value for multiple components in one call
+
+        Each value is set with GuiVComponent.set_text, in the order of the mapping.
+
+        Parameters
+        ----------
+        values : dict[str, Any]
+            Mapping of component ID to the value to set or select
+        raise_error : bool, optional
+            If true, raises exception when a component is read-only (not changeable), by default True
+
+        Returns
+        -------
+        bool
+            True if all values were set successfully, False otherwise
 
-        return GuiVComponent(element)
+        Raises
+        ------
+        SAPElementNotFound
+            If a component is not found
+        SAPElementNotChangeable
+            If a component is not changeable and raise_error is True
+        """
+        find = self.find_by_id
+        results = [
+            find(id).set_text(value, raise_error=raise_error)
+            for id, value in values.items()
+        ]
+        return all(results)
 
     def send_vkey(self, key: VKey | int, window_index: int = 0, repeat_count: int = 1):
         """Sends a VKey to a specific SAP window
@@ -143,12 +229,14 @@ class GuiSession:
             If the window is not found
         """
 
-        wnd_id = f"wnd[{window_index}]"
-        wnd = self._com_session.findById(wnd_id, False)
+        wnd_id = _window_id(window_index)
+        wnd = self._com_session.FindById(wnd_id, False)
         if wnd:
-            val = key.value if isinstance(key, VKey) else key
+            val = int(key)
+            send = wnd.SendVKey
             for _ in range(repeat_count):
-                wnd.sendVKey(val)
+                send(val)
+            self.clear_cache()
         else:
             raise SAPElementNotFound(f"Window {wnd_id} not found to send key.")
 
@@ -174,25 +262,31 @@ class GuiSession:
         window_index : int, optional
             The index of the popup dialog window, by default 1
         limit : int | None, optional
-            The maximum number of popups to dismiss, by default None
+            The maximum number of popups to dismiss, by default None (until no popup is left)
         """
-        window_id = f"wnd[{window_index}]"
+        window_id = _window_id(window_index)
+        find = self.find_by_id
         count = 0
+        wnd = find(window_id, raise_error=False)
         while True:
-            if limit and count >= limit:
+            if limit is not None and count >= limit:
                 logger.debug(f"Reached limit of dismissing {limit} popups. Stopping.")
                 return
 
-            wnd = self.find_by_id(window_id, raise_error=False)
             if not wnd:
                 logger.debug("No more popup dialogs found. Stopping.")
                 return
 
-            if wnd.type == GuiObject.MODAL_WINDOW and wnd.isPopupDialog:
-                logger.debug(
-                    f"Dismissing popup dialog:\ntitle: {wnd.text}\ntext: {wnd.PopupDialogText}"
-                )
+            if wnd.type == GUI_MODAL_WINDOW and wnd.IsPopupDialog:
+                # Reading the title and text are COM calls, only pay for them when the message is emitted
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Dismissing popup dialog:\ntitle: {wnd.text}\ntext: {wnd.PopupDialogText}"
+                    )
                 wnd.send_vkey(key)
+                count += 1
+                # The key press closes or replaces the popup, so the window has to be resolved again
+                wnd = find(window_id, raise_error=False)
             else:
                 logger.debug("No more popup dialogs found. Stopping.")
                 return
@@ -201,6 +295,9 @@ class GuiSession:
         """
         Retreives the current status bar message.
 
+        If the session was created with cache_elements=True, the message is read once
+        and reused until the next action of this library that can change the screen.
+
         Returns
         -------
         StatusbarMsg
@@ -211,18 +308,26 @@ class GuiSession:
         SAPElementNotFound
             If the statusbar is not found in the window
         """
-        sbar = self.find_by_id(ControlID.STATUS_BAR, False)
-        if not sbar:
+        if self._statusbar_msg is not None:
+            return self._statusbar_msg
+
+        # Only message properties are read, so the raw COM element is used instead of
+        # find_by_id, which would also read the Type of the status bar for the wrapper
+        sbar = self._com_session.FindById(ControlID.STATUS_BAR, False)
+        if sbar is None:
             raise SAPElementNotFound("Status bar not found")
 
-        return StatusbarMsg(
+        msg = StatusbarMsg(
             id=sbar.MessageId,
             number=sbar.MessageNumber,
-            text=sbar.text,
+            text=as_stripped_str(sbar.Text),
             type=sbar.MessageType,
             has_longtext=sbar.MessageHasLongtext,
             is_popup=sbar.MessageAsPopup,
         )
+        if self._cache_elements:
+            self._statusbar_msg = msg
+        return msg
 
     def raise_for_status(
         self,
@@ -268,25 +373,26 @@ class GuiSession:
         exception
             If the window is a modal window and not a popup dialog
         """
-        wnd = self.find_by_id(f"wnd[{window_index}]", raise_error=False)
+        wnd = self.find_by_id(_window_id(window_index), raise_error=False)
 
         if not wnd:
             return
 
-        is_popup = wnd.isPopupDialog
+        is_popup = wnd.IsPopupDialog
 
         if is_popup:
             return
 
         # It's a modal window but NOT a dismissable popup
-        title = str(wnd.text).strip()
-        dlg_text = str(wnd.PopupDialogText).strip()
+        # GuiVComponent.text is already a stripped str, PopupDialogText is a BSTR
+        title = wnd.text
+        dlg_text = wnd.PopupDialogText.strip()
         error_message = f"{title}: {dlg_text}" if dlg_text else title
         raise exception(f"{message}: {error_message}")
 
     def maximize(self) -> None:
         """Maximizes the main window."""
-        self.find_by_id(GuiObject.MAIN_WINDOW).maximize()
+        self.find_by_id(ControlID.MAIN_WINDOW).Maximize()
 
     def start_transaction(self, tcode: str) -> bool:
         """
@@ -310,10 +416,11 @@ class GuiSession:
         """
         logger.debug(f"Starting transaction: {tcode}")
         self._com_session.StartTransaction(tcode)
+        self.clear_cache()
 
         # Check if tcode was valid
         status = self.get_statusbar_msg()
-        if status.text and "does not exist" in status.text.lower():
+        if status.text and _TCODE_NOT_FOUND_RE.search(status.text):
             raise SAPTransactionError(f"Transaction {tcode} failed: {status.text}")
 
         return True
@@ -321,6 +428,7 @@ class GuiSession:
     def end_transaction(self) -> None:
         """Ends the current SAP transaction. (equivalent to /n)"""
         self._com_session.EndTransaction()
+        self.clear_cache()
 
     def get_session_info(self) -> SessionInfo:
         """
@@ -331,7 +439,7 @@ class GuiSession:
         SessionInfo
             Details of the current session
         """
-        info = self._com_session.info
+        info = self._com_session.Info
         return SessionInfo(
             application_server=info.ApplicationServer,
             client=info.Client,
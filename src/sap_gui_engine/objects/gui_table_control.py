@@ -1,13 +1,16 @@
 import logging
 from typing import TYPE_CHECKING, Any
 
-from sap_gui_engine.constants import GuiObject, VKey
+from sap_gui_engine.constants import GUI_COMBO_BOX, GUI_TABLE_CONTROL, VKey
 from sap_gui_engine.exceptions import (
+    SAPComboBoxOptionNotFound,
     SAPElementNotChangeable,
+    SAPElementNotFound,
     SAPTableConfigurationError,
 )
+from sap_gui_engine.utils import as_stripped_str, find_combobox_key
 
-from .gui_vcomponent import GuiVComponent
+from .com_wrapper import ComWrapper
 
 if TYPE_CHECKING:
     from .gui_session import GuiSession
@@ -15,38 +18,36 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class GuiTableControl:
+class GuiTableControl(ComWrapper):
+    __slots__ = (
+        "id",
+        "_com_element",
+        "__parent_class__",
+        "headers",
+        "_combo_columns",
+    )
+
     def __init__(
         self,
         com_element: Any,
         table_id: str,
         __parent_class__: "GuiSession",
+        element_type: str | None = None,
     ):
-        if com_element.type != GuiObject.TABLE_CONTROL:
+        # find_by_id passes the Type it already read, which saves a second COM call
+        if element_type is None:
+            element_type = com_element.Type
+        if element_type != GUI_TABLE_CONTROL:
             raise SAPElementNotChangeable(
-                f"Element {com_element.name} is not a GuiTableControl. It is a {com_element.type} type"
+                f"Element {com_element.Name} is not a GuiTableControl. It is a {element_type} type"
             )
 
         self.id = table_id
         self._com_element = com_element
         self.__parent_class__ = __parent_class__
-
-    def __getattr__(self, name: str) -> Any:
-        """Delegate attribute access to the underlying SAP element."""
-        return getattr(self._com_element, name)
-
-    def __setattr__(self, name, value):
-        """
-        Set attributes on this class instance or delegate to the underlying _com_element if the attribute does not exist on the class instnace.
-        """
-        try:
-            element = object.__getattribute__(self, "_com_element")
-            if hasattr(element, name):
-                setattr(element, name, value)
-        except AttributeError:
-            # Fallback
-            pass
-        object.__setattr__(self, name, value)
+        self.headers: dict[str, int] = {}
+        # Whether the cells of a column index are comboboxes, read from the first cell of the column
+        self._combo_columns: dict[int, bool] = {}
 
     @property
     def visible_rows(self) -> int:
@@ -80,7 +81,7 @@ class GuiTableControl:
 
         full_map = {}
         for i, col in enumerate(self._com_element.Columns):
-            title = str(getattr(col, "title", "") or "").strip()
+            title = as_stripped_str(getattr(col, "Title", "") or "")
             if lowercase:
                 title = title.lower()
 
@@ -105,6 +106,52 @@ class GuiTableControl:
 
         return full_map
 
+    def get_column_texts(self, column: str | int, strip_text: bool = True) -> list[str]:
+        """
+        Reads the text of every visible row of a column
+
+        Only the rows currently shown by the table control are read, starting at the current
+        scroll position, scroll the table to read further rows. Empty rows past the end of
+        the table are not read.
+
+        Parameters
+        ----------
+        column : str | int
+            Header name (case-insensitive) or index of the column
+        strip_text : bool, optional
+            Whether to strip the leading and trailing whitespaces of the texts, by default True
+
+        Returns
+        -------
+        list[str]
+            Text of the column's cells, from the first visible row to the last
+
+        Raises
+        ------
+        SAPTableConfigurationError
+            If no column with the given header name exists
+        """
+        if isinstance(column, str):
+            col_idx = self.get_table_headers().get(column.strip().lower())
+            if col_idx is None:
+                raise SAPTableConfigurationError(
+                    f"Column '{column}' not found in table {self.id}"
+                )
+        else:
+            col_idx = column
+
+        # One GetCell and one Text read per row, the method is bound once for the whole column
+        com_element = self._com_element
+        get_cell = com_element.GetCell
+        # GetCell rows are relative to the scroll position, the rows left below it may
+        # be fewer than the visible ones on the last page
+        remaining_rows = com_element.RowCount - com_element.VerticalScrollbar.Position
+        row_count = max(0, min(remaining_rows, com_element.VisibleRowCount))
+        texts = [get_cell(row_idx, col_idx).Text for row_idx in range(row_count)]
+        if strip_text:
+            return [as_stripped_str(text) for text in texts]
+        return texts
+
     def fill(
         self,
         data: list[dict[str, Any]],
@@ -151,15 +198,23 @@ class GuiTableControl:
             not case_sensitive,
         )
 
-        logger.debug(f"Table headers: {self.headers}")
+        self._combo_columns = {}
+        logger.debug("Table headers: %s", self.headers)
         if not case_sensitive:
             # Make all the keys in the data to lower case
             data = [{k.lower(): v for k, v in row.items()} for row in data]
 
+        # Only the headers that occur in the data are visited for each row
+        data_keys = set().union(*data)
+        columns = [(col, idx) for col, idx in self.headers.items() if col in data_keys]
+
         # Check if table is empty (scroll max == 0 usually implies empty or single page)
         is_table_empty = self.VerticalScrollbar.Maximum == 0
         logger.info(
-            f"Filling table {self.id} ({len(data)} rows). Mode: {'Fill empty' if is_table_empty else 'Overwrite'}"
+            "Filling table %s (%d rows). Mode: %s",
+            self.id,
+            len(data),
+            "Fill empty" if is_table_empty else "Overwrite",
         )
         # Reset scroll position for overwriting existing data
         if not is_table_empty:
@@ -172,6 +227,7 @@ class GuiTableControl:
 
         self._fill_table(
             data=data,
+            columns=columns,
             pagination_key=pagination_key,
             next_row_idx_after_pagination=next_row_idx_after_pagination,
             set_focus=set_focus,
@@ -180,6 +236,7 @@ class GuiTableControl:
     def _fill_table(
         self,
         data: list[dict[str, Any]],
+        columns: list[tuple[str, int]],
         pagination_key: VKey,
         next_row_idx_after_pagination: int,
         set_focus: bool = False,
@@ -192,7 +249,11 @@ class GuiTableControl:
         for row in data:
             # Update all cells for the current row
             self._upate_row_cells(
-                row_idx=current_row_idx, row=row, page=page, set_focus=set_focus
+                row_idx=current_row_idx,
+                row=row,
+                columns=columns,
+                page=page,
+                set_focus=set_focus,
             )
 
             # SAP quirk: Pagination logic after reaching the last visible row
@@ -222,22 +283,31 @@ class GuiTableControl:
         self,
         row_idx: int,
         row: dict[str, Any],
+        columns: list[tuple[str, int]],
         page: int,
         set_focus: bool = False,
     ):
         # Note: I chose to iterate over colum_map, because length of column_map might be lesser than the length of row
-        for col, col_idx in self.headers.items():
-            if col in row and row.get(col) is not None:
-                logger.debug(
-                    f"Updating {col} of row {row_idx} to value: {row[col]} | col_idx: {col_idx} | Page: {page}"
-                )
-                self._update_cell(
-                    row_idx=row_idx,
-                    col_idx=col_idx,
-                    value=row[col],
-                    col_name=col,
-                    set_focus=set_focus,
-                )
+        for col, col_idx in columns:
+            value = row.get(col)
+            if value is None:
+                continue
+
+            logger.debug(
+                "Updating %s of row %d to value: %s | col_idx: %d | Page: %d",
+                col,
+                row_idx,
+                value,
+                col_idx,
+                page,
+            )
+            self._update_cell(
+                row_idx=row_idx,
+                col_idx=col_idx,
+                value=value,
+                col_name=col,
+                set_focus=set_focus,
+            )
 
     def _update_cell(
         self,
@@ -249,22 +319,49 @@ class GuiTableControl:
     ) -> None:
         cell = self.GetCell(row_idx, col_idx)
         if set_focus:
-            cell.setFocus()
+            cell.SetFocus()
 
-        # Check if the cell is a combobox and convert it to a GuiComponent type to support setting the combobox values by .text property
-        if cell.type == GuiObject.COMBO_BOX:
-            cell = GuiVComponent(cell)
+        # All cells of a table column share the same type, so it is read from COM once per column
+        is_combo_box = self._combo_columns.get(col_idx)
+        if is_combo_box is None:
+            is_combo_box = self._combo_columns[col_idx] = cell.Type == GUI_COMBO_BOX
 
         # only update if the cell is changeable
-        if cell.changeable:
-            cell.text = str(value).strip()
+        if is_combo_box:
+            if cell.Changeable:
+                self._select_combobox_entry(cell, value)
+                return
+        elif cell.Changeable:
+            cell.Text = as_stripped_str(value)
             return
 
         logger.warning(
-            f"Cell of column '{col_name}' at {row_idx}, {col_idx} is not changeable"
+            "Cell of column '%s' at %d, %d is not changeable", col_name, row_idx, col_idx
         )
         return
 
+    def _select_combobox_entry(self, cell: Any, value: Any) -> None:
+        """
+        Selects the entry matching value in a combobox cell (case-insensitive)
+
+        The entries can differ from row to row, so every cell is matched against its own entries.
+        The scan stops at the first match instead of indexing all entries of the cell.
+
+        Raises
+        ------
+        SAPComboBoxOptionNotFound
+            If the cell has no entry matching value
+        """
+        text = as_stripped_str(value)
+        key = find_combobox_key(cell, text)
+        if key is None:
+            raise SAPComboBoxOptionNotFound(
+                f"Option '{text}' not found in ComboBox {cell.Name}"
+            )
+
+        cell.Key = key
+        self.__parent_class__.clear_cache()
+
     def _paginate_table(
         self,
         pagination_key: VKey,
@@ -281,4 +378,12 @@ class GuiTableControl:
         """
         Refreshes the underlying GuiTableControl object reference
         """
-        self._com_element = self.__parent_class__.find_by_id(self.id)
+        # Scrolling the table does not go through the session, so the cached references are stale
+        session = self.__parent_class__
+        session.clear_cache()
+        # find_by_id would wrap the table in a new GuiTableControl and read its Type twice,
+        # only the raw COM object is needed here
+        com_element = session.session.FindById(self.id, False)
+        if com_element is None:
+            raise SAPElementNotFound(f"The element with ID: {self.id} not found")
+        self._com_element = com_element
@@ -1,65 +1,97 @@
 import logging
+import sys
 from datetime import date
-from typing import Any
-
-from sap_gui_engine.constants import GuiObject, VKey
+from typing import TYPE_CHECKING, Any, Final
+
+from sap_gui_engine.constants import (
+    GUI_BUTTON,
+    GUI_CHECKBOX,
+    GUI_COMBO_BOX,
+    GUI_RADIO_BUTTON,
+    GUI_TAB,
+    VKey,
+)
 from sap_gui_engine.exceptions import (
     SAPComboBoxOptionNotFound,
     SAPElementNotChangeable,
     SAPElementTypeMismatch,
 )
+from sap_gui_engine.utils import as_stripped_str, build_combobox_index
+
+from .com_wrapper import ComWrapper
+
+if TYPE_CHECKING:
+    from .gui_session import GuiSession
 
 logger = logging.getLogger(__name__)
 
+# Marks a lazily read COM property that has not been fetched yet
+_UNSET: Final = object()
+
+
+def _press(com_element: Any) -> None:
+    com_element.Press()
+
+
+def _select(com_element: Any) -> None:
+    com_element.Select()
 
-class GuiVComponent:
+
+def _toggle(com_element: Any) -> None:
+    com_element.Selected = not com_element.Selected
+
+
+class GuiVComponent(ComWrapper):
     """
     Wrapper around the generatic SAP GUI visual component.
     Delegates attribute access to the underlying COM object while providing helper methods
     """
 
-    def __init__(self, com_element: Any):
-        self._com_element = com_element
-        pass
-
-    def __getattr__(self, name: str) -> Any:
-        """Delegate attribute access to the underlying SAP element."""
-        return getattr(self._com_element, name)
+    __slots__ = ("_com_element", "_session", "_name", "_type", "_combo_index")
 
-    def __setattr__(self, name, value):
-        """
-        Set attributes on this class instance or delegate to the underlying _com_element if the attribute does not exist on the class instnace.
-        """
-        try:
-            element = object.__getattribute__(self, "_com_element")
-            if hasattr(element, name):
-                setattr(element, name, value)
-        except AttributeError:
-            # Fallback
-            pass
+    # Click action per element type, saves probing the COM object with hasattr on every click.
+    # Keyed by the plain str constants, an enum member key never matches the type on identity.
+    _CLICK_ACTIONS = {
+        GUI_BUTTON: _press,
+        GUI_TAB: _select,
+        GUI_RADIO_BUTTON: _select,
+        GUI_CHECKBOX: _toggle,
+    }
 
-        object.__setattr__(self, name, value)
+    def __init__(self, com_element: Any, session: "GuiSession | None" = None):
+        self._com_element = com_element
+        self._session = session
+        self._name = _UNSET
+        self._type = _UNSET
+        self._combo_index: dict[str, str] | None = None
 
     @property
     def element(self) -> Any:
         """Access the raw COM element."""
         return self._com_element
 
+    # hasattr() on a COM object already performs the property read, so a
+    # single getattr() with a default halves the round trips.
+    # Name and Type never change for a component, so they are read once on first access.
     @property
     def name(self) -> str | None:
-        if hasattr(self._com_element, "Name"):
-            return self._com_element.Name
+        if self._name is _UNSET:
+            self._name = getattr(self._com_element, "Name", None)
+        return self._name
 
     @property
     def type(self) -> str | None:
-        if hasattr(self._com_element, "Type"):
-            return self._com_element.Type
+        if self._type is _UNSET:
+            element_type = getattr(self._com_element, "Type", None)
+            # Interned so comparisons and lookups against the type constants can match on identity
+            self._type = (
+                sys.intern(element_type) if isinstance(element_type, str) else element_type
+            )
+        return self._type
 
     @property
     def changeable(self) -> bool:
-        if hasattr(self._com_element, "Changeable"):
-            return self._com_element.Changeable
-        return False
+        return getattr(self._com_element, "Changeable", False)
 
     def visualize(self, value: bool) -> bool:
         """
@@ -75,16 +107,16 @@ class GuiVComponent:
         bool
             True if the operation was successful, False otherwise.
         """
-        if hasattr(self._com_element, "Visualize"):
-            return bool(self._com_element.Visualize(value))
-        return False
+        visualize = getattr(self._com_element, "Visualize", None)
+        if visualize is None:
+            return False
+        return bool(visualize(value))
 
     @property
     def text(self) -> str:
         """Gets the text property, stripped of whitespace."""
         # Use getattr to avoid failing if .text doesn't exist (though it usually does)
-        val = getattr(self._com_element, "text", "")
-        return str(val).strip()
+        return as_stripped_str(getattr(self._com_element, "Text", ""))
 
     @text.setter
     def text(self, value: str) -> None:
@@ -112,10 +144,12 @@ class GuiVComponent:
         -------
         str
         """
+        # Both read Text live, the text property already returns a stripped str
         if strip_text:
-            return str(self.text).strip()
+            return self.text
 
-        return self.text
+        val = getattr(self._com_element, "Text", "")
+        return val if type(val) is str else str(val)
 
     def set_text(
         self,
@@ -161,8 +195,12 @@ class GuiVComponent:
         SAPElementNotChangeable
             If the element is not changeable and raise_error is True
         """
-        if not self.changeable:
-            msg = f"Element {self.name} ({self.type}) is not changeable."
+        # Bound once, every attribute on the COM element is a late-bound dispatch
+        com_element = self._com_element
+        element_type = self.type
+
+        if not getattr(com_element, "Changeable", False):
+            msg = f"Element {self.name} ({element_type}) is not changeable."
             if raise_error:
                 raise SAPElementNotChangeable(msg)
 
@@ -173,20 +211,20 @@ class GuiVComponent:
             value = value.strftime(date_format)
 
         if strip_value:
-            value = str(value).strip()
+            value = as_stripped_str(value)
 
-        if self.type == GuiObject.COMBO_BOX:
+        if element_type == GUI_COMBO_BOX:
             return self._select_combobox_entry(value)
 
-        max_length = getattr(self._com_element, "maxLength", None)
+        max_length = getattr(com_element, "MaxLength", None)
 
         if max_length and len(value) > max_length:
             value = value[:max_length]
 
         if set_focus:
-            self._com_element.SetFocus()
+            com_element.SetFocus()
 
-        self._com_element.text = value
+        com_element.Text = value
         return True
 
     def select_combobox(
@@ -199,7 +237,7 @@ class GuiVComponent:
         """
         Alias for set_text for selecting combobox entries.
         """
-        if self.type != GuiObject.COMBO_BOX:
+        if self.type != GUI_COMBO_BOX:
             raise SAPElementTypeMismatch(
                 f"Element {self.name} is not a combobox. It is a {self.type}"
             )
@@ -224,11 +262,11 @@ class GuiVComponent:
         SAPElementTypeMismatch
             If the element is not a checkbox.
         """
-        if self.type != GuiObject.CHECKBOX:
+        if self.type != GUI_CHECKBOX:
             raise SAPElementTypeMismatch(
                 f"Element {self.name} is not a checkbox. It is a {self.type}"
             )
-        return bool(self._com_element.selected)
+        return bool(self._com_element.Selected)
 
     def set_focus(self):
         """
@@ -240,6 +278,9 @@ class GuiVComponent:
         """
         Selects a ComboBox entry by matching option's text (case-insensitive)
 
+        The entries are read once into a lowercase value to key index, later
+        selections on the same element are a dictionary lookup.
+
         Parameters
         ----------
         text : str
@@ -250,17 +291,22 @@ class GuiVComponent:
         bool
             True if selected
         """
+        if self._combo_index is None:
+            self._combo_index = build_combobox_index(self._com_element)
+            logger.debug("Entries: %s", self._combo_index)
+
         target = text.strip().lower()
-        logger.debug(f"Target: {target}")
-        for entry in self._com_element.entries:
-            logger.debug(f"Entry: {entry.value.strip().lower()}")
-            if str(entry.value).strip().lower() == target:
-                self._com_element.key = entry.key
-                return True
-
-        raise SAPComboBoxOptionNotFound(
-            f"Option '{text}' not found in ComboBox {self.name}"
-        )
+        logger.debug("Target: %s", target)
+        key = self._combo_index.get(target)
+        # Keys like "" or "0" are valid, only a missing entry is an error
+        if key is None:
+            raise SAPComboBoxOptionNotFound(
+                f"Option '{text}' not found in ComboBox {self.name}"
+            )
+
+        self._com_element.Key = key
+        self._clear_session_cache()
+        return True
 
     def click(self) -> bool:
         """
@@ -278,27 +324,33 @@ class GuiVComponent:
             True if the action was successful, False otherwise
         """
 
-        # Try standard methods
-        if hasattr(self._com_element, "press"):
-            self._com_element.press()
-            return True
-
-        if hasattr(self._com_element, "select"):
-            self._com_element.select()
-            return True
-
-        # Checkboxes often use 'selected' property
-        if hasattr(self._com_element, "selected"):
-            self._com_element.selected = not self._com_element.selected
-            return True
-
-        logger.warning(f"Element {self.name} ({self.type}) is not clickable.")
-        return False
+        action = self._CLICK_ACTIONS.get(self.type)
+        if action is None:
+            # Other element types: try standard methods
+            com_element = self._com_element
+            if hasattr(com_element, "Press"):
+                action = _press
+            elif hasattr(com_element, "Select"):
+                action = _select
+            # Checkboxes often use 'Selected' property
+            elif hasattr(com_element, "Selected"):
+                action = _toggle
+            else:
+                # Name is only read from COM when the warning is actually emitted
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Element %s (%s) is not clickable.", self.name, self.type
+                    )
+                return False
+
+        action(self._com_element)
+        self._clear_session_cache()
+        return True
 
     def send_vkey(self, key: VKey | int) -> None:
         """Sends a virtual key to this element (usually a window)."""
-        val = key.value if isinstance(key, VKey) else key
-        self._com_element.sendVKey(val)
+        self._com_element.SendVKey(int(key))
+        self._clear_session_cache()
 
     def press(self):
         """Alias for click()"""
@@ -307,3 +359,10 @@ class GuiVComponent:
     def select(self):
         """Alias for click()"""
         return self.click()
+
+    def _clear_session_cache(self) -> None:
+        """
+        Clears the find_by_id cache of the owning session after an action that may change the screen
+        """
+        if self._session is not None:
+            self._session.clear_cache()
@@ -1 +1,3 @@
+from .combobox import build_combobox_index, find_combobox_key
 from .launcher import is_process_running, launch_application
+from .text import as_stripped_str
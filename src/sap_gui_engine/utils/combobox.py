@@ -0,0 +1,52 @@
+from typing import Any
+
+
+def build_combobox_index(com_element: Any) -> dict[str, str]:
+    """
+    Maps the stripped, lowercase value of every entry of a GuiComboBox to its key.
+
+    Every Value/Key read is a COM call, so the entries are walked only once.
+    For duplicate values the first entry is kept.
+
+    Parameters
+    ----------
+    com_element : Any
+        The native GuiComboBox COM object
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of lowercase entry value to entry key
+    """
+    combo_index: dict[str, str] = {}
+    for entry in com_element.Entries:
+        value = entry.Value
+        normalized = value.strip().lower() if value else ""
+        combo_index.setdefault(normalized, entry.Key)
+    return combo_index
+
+
+def find_combobox_key(com_element: Any, text: str) -> str | None:
+    """
+    Finds the key of the first entry of a GuiComboBox whose value matches text (case-insensitive).
+
+    The entries are scanned in order and the scan stops at the first match.
+
+    Parameters
+    ----------
+    com_element : Any
+        The native GuiComboBox COM object
+    text : str
+        Value of the entry to find, leading and trailing whitespaces are ignored
+
+    Returns
+    -------
+    str | None
+        Key of the matching entry, None if no entry matches
+    """
+    target = text.strip().lower()
+    for entry in com_element.Entries:
+        value = entry.Value
+        if (value.strip().lower() if value else "") == target:
+            return entry.Key
+    return None
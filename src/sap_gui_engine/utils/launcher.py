@@ -1,8 +1,9 @@
+import ctypes
+import functools
 import logging
-import subprocess
 import sys
+from ctypes import wintypes
 from pathlib import Path
-from typing import Union
 
 from pywinauto.application import Application
 
@@ -10,11 +11,55 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 60
 
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class _ProcessEntry32W(ctypes.Structure):
+    """PROCESSENTRY32W structure filled by Process32FirstW/Process32NextW."""
+
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+
+@functools.cache
+def _kernel32() -> "ctypes.WinDLL":
+    """Loads kernel32 with the Toolhelp32 function signatures, once per process (Windows only)."""
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(_ProcessEntry32W),
+    ]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(_ProcessEntry32W),
+    ]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    return kernel32
+
 
 def is_process_running(process_name: str) -> bool:
     """
     Checks if a process with the given name is running.
 
+    Enumerates the running processes in-process through a Toolhelp32 snapshot
+    and stops at the first process whose executable name matches (case-insensitive).
+
     Note: Currently only supports Windows systems.
 
     Parameters
@@ -30,15 +75,28 @@ def is_process_running(process_name: str) -> bool:
     if sys.platform != "win32":
         raise NotImplementedError("is_process_running is only supported on Windows")
 
-    try:
-        output = subprocess.check_output(
-            "tasklist", shell=True, text=True, stderr=subprocess.DEVNULL
+    kernel32 = _kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == INVALID_HANDLE_VALUE:
+        # If the snapshot cannot be taken, assume process is not running
+        logger.warning(
+            f"Could not enumerate processes, error code: {ctypes.get_last_error()}"
         )
-        return process_name.lower() in output.lower()
-    except subprocess.CalledProcessError:
-        # If tasklist command fails, assume process is not running
         return False
 
+    target = process_name.casefold()
+    entry = _ProcessEntry32W()
+    entry.dwSize = ctypes.sizeof(_ProcessEntry32W)
+    try:
+        has_entry = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while has_entry:
+            if entry.szExeFile.casefold() == target:
+                return True
+            has_entry = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
+    finally:
+        kernel32.CloseHandle(snapshot)
+
 
 def launch_application(
     executable_path: Path | str,
@@ -50,7 +108,7 @@ def launch_application(
 
     Parameters
     ----------
-    executable_path : Union[Path, str]
+    executable_path : Path | str
         Path to the executable file to launch
     window_title_pattern : str
         Title pattern of the window to wait for after launching the application
@@ -0,0 +1,18 @@
+from typing import Any
+
+
+def as_stripped_str(value: Any) -> str:
+    """
+    Strips the leading and trailing whitespaces of a value, converting it to str first only if it is not one already.
+
+    Parameters
+    ----------
+    value : Any
+        The value to strip, usually a text read from a SAP GUI COM object
+
+    Returns
+    -------
+    str
+    """
+    # pywin32 returns BSTRs as exact str, the type check skips str() and the isinstance MRO walk
+    return value.strip() if type(value) is str else str(value).strip()
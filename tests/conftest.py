@@ -1,7 +1,20 @@
+from datetime import date
+
 import pytest
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from sap_gui_engine import SAPGuiEngine
+from sap_gui_engine import GuiSession, SAPGuiEngine
+
+# (transaction, program, screen number) of the VA01 screens used by the tests
+VA01_INITIAL_SCREEN = ("VA01", "SAPMV45A", 101)
+VA01_OVERVIEW_SCREEN = ("VA01", "SAPMV45A", 4001)
+
+VA01_HEADER = {
+    "wnd[0]/usr/ctxtVBAK-AUART": "ZWEO",
+    "wnd[0]/usr/ctxtVBAK-VKORG": "2200",
+    "wnd[0]/usr/ctxtVBAK-VTWEG": "10",
+    "wnd[0]/usr/ctxtVBAK-SPART": "00",
+}
 
 
 class SAPConfig(BaseSettings):
@@ -17,11 +30,55 @@ class SAPConfig(BaseSettings):
     window_title_re: str = "SAP Logon 800"
 
 
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--sap-keep-session",
+        action="store_true",
+        default=False,
+        help="Leave the SAP session logged in after the run, the next run attaches to it instead of logging in again",
+    )
+
+
 @pytest.fixture(scope="session")
-def session():
+def session(request: pytest.FixtureRequest):
     config = SAPConfig().model_dump()
     print(config)
     sap = SAPGuiEngine(**config)
+    # Attaches to a running SAP Logon and an open connection of the user when there is one
     session = sap.open_connection()
     yield session
-    session.close()
+    if not request.config.getoption("--sap-keep-session"):
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def today_ddmmyyyy() -> str:
+    """Today's date in the dd.mm.yyyy format of SAP date fields, fixed for the whole test run."""
+    return date.today().strftime("%d.%m.%Y")
+
+
+def _current_screen(session: GuiSession) -> tuple[str, str, int]:
+    info = session.Info
+    return info.Transaction, info.Program, info.ScreenNumber
+
+
+@pytest.fixture
+def va01(session: GuiSession) -> GuiSession:
+    """Session on the VA01 initial screen, the transaction is only restarted when not already there."""
+    if _current_screen(session) != VA01_INITIAL_SCREEN:
+        session.start_transaction(tcode="va01")
+    return session
+
+
+@pytest.fixture
+def va01_overview(session: GuiSession) -> GuiSession:
+    """Session on the VA01 overview screen, the header is only entered when not already there."""
+    screen = _current_screen(session)
+    if screen == VA01_OVERVIEW_SCREEN:
+        return session
+
+    if screen != VA01_INITIAL_SCREEN:
+        session.start_transaction(tcode="va01")
+    session.set_texts(VA01_HEADER)
+    session.press_enter()
+    return session
@@ -0,0 +1,18 @@
+from sap_gui_engine import GuiSession
+
+ORDER_TYPE_ID = "wnd[0]/usr/ctxtVBAK-AUART"
+
+
+def test_find_by_id_not_cached_by_default(va01: GuiSession):
+    first = va01.find_by_id(ORDER_TYPE_ID)
+    assert va01.find_by_id(ORDER_TYPE_ID) is not first
+
+
+def test_find_by_id_cache_cleared_on_enter(va01: GuiSession):
+    cached = GuiSession(va01.session, cache_elements=True)
+
+    first = cached.find_by_id(ORDER_TYPE_ID)
+    assert cached.find_by_id(ORDER_TYPE_ID) is first
+
+    cached.press_enter()
+    assert cached.find_by_id(ORDER_TYPE_ID) is not first
@@ -0,0 +1,20 @@
+from sap_gui_engine import GuiSession
+
+SE16N_SELFIELDS_TABLE_ID = "wnd[0]/usr/tblSAPLSE16NSELFIELDS_TC"
+
+
+def test_get_column_texts_last_page(session: GuiSession):
+    session.start_transaction(tcode="se16n")
+    session.find_by_id("wnd[0]/usr/ctxtGD-TAB").text = "VBAK"
+    session.press_enter()
+
+    table = session.find_by_id(SE16N_SELFIELDS_TABLE_ID)
+    row_count = table.RowCount
+    assert len(table.get_column_texts(0)) == min(row_count, table.VisibleRowCount)
+
+    # Scroll so only the last row of the table is left below the scroll position
+    table.VerticalScrollbar.Position = row_count - 1
+
+    # Find the table again, scrolling re-renders the screen
+    table = session.find_by_id(SE16N_SELFIELDS_TABLE_ID)
+    assert len(table.get_column_texts(0)) == 1
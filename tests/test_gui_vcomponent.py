@@ -1,32 +1,30 @@
-from datetime import date
-
 import pytest
 
 from sap_gui_engine import GuiSession
 from sap_gui_engine.exceptions import SAPElementNotChangeable
 
+# IDs of the VA01 overview elements and the SE16N selection field checkbox used below
+NET_VALUE_ID = "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/txtVBAK-NETWR"
+SOLD_TO_PARTY_ID = "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/subPART-SUB:SAPMV45A:4701/ctxtKUAGV-KUNNR"
+BILLING_BLOCK_ID = "wnd[0]/usr/tabsTAXI_TABSTRIP_OVERVIEW/tabpT\\01/ssubSUBSCREEN_BODY:SAPMV45A:4400/ssubHEADER_FRAME:SAPMV45A:4440/cmbVBAK-FAKSK"
+PO_DATE_ID = "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/ctxtVBKD-BSTDK"
+PO_NUMBER_ID = "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/txtVBKD-BSTKD"
+ITEM_OVERVIEW_TAB_ID = "wnd[0]/usr/tabsTAXI_TABSTRIP_OVERVIEW/tabpT\\02"
+SE16N_MARK_CHECKBOX_ID = "wnd[0]/usr/tblSAPLSE16NSELFIELDS_TC/chkGS_SELFIELDS-MARK[5,1]"
+
 
-def test_constructor(session: GuiSession):
-    session.start_transaction(tcode="va01")
+def test_constructor(va01: GuiSession):
     # Sales Organization label id
-    element = session.find_by_id("wnd[0]/usr/lblVBAK-VKORG")
+    element = va01.find_by_id("wnd[0]/usr/lblVBAK-VKORG")
     assert element.name == "VBAK-VKORG"
     assert element.type == "GuiLabel"
     assert element.text == "Sales Organization"
     assert element.changeable is False
 
 
-def test_set_text_non_changeable(session: GuiSession):
-    session.find_by_id("wnd[0]/usr/ctxtVBAK-AUART").text = "ZWEO"
-    session.find_by_id("wnd[0]/usr/ctxtVBAK-VKORG").text = "2200"
-    session.find_by_id("wnd[0]/usr/ctxtVBAK-VTWEG").text = "10"
-    session.find_by_id("wnd[0]/usr/ctxtVBAK-SPART").text = "00"
-    session.press_enter()
-
+def test_set_text_non_changeable(va01_overview: GuiSession):
     # Get the unchangeable text field
-    element = session.find_by_id(
-        "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/txtVBAK-NETWR"
-    )
+    element = va01_overview.find_by_id(NET_VALUE_ID)
 
     assert element.type == "GuiTextField"
     assert element.changeable is False
@@ -40,56 +38,39 @@ def test_set_text_non_changeable(session: GuiSession):
 
 def test_click_button(session: GuiSession):
     assert session.find_by_id("wnd[0]/tbar[0]/btn[15]").click() is True
-    session.start_transaction(tcode="va01")
-    session.press_enter()
 
 
-def test_set_text_field(session: GuiSession):
-    element = session.find_by_id(
-        "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/subPART-SUB:SAPMV45A:4701/ctxtKUAGV-KUNNR"
-    )
+def test_set_text_field(va01_overview: GuiSession):
+    element = va01_overview.find_by_id(SOLD_TO_PARTY_ID)
     element.text = "102133"
 
-    # Refresh element
-    element = session.find_by_id(
-        "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/subPART-SUB:SAPMV45A:4701/ctxtKUAGV-KUNNR"
-    )
+    # Find the element again to read the value back from SAP (the session does not cache)
+    element = va01_overview.find_by_id(SOLD_TO_PARTY_ID)
     assert element.text == "102133"
     assert element.type == "GuiCTextField"
 
 
-def test_set_text_combobox(session: GuiSession):
+def test_set_text_combobox(va01_overview: GuiSession):
     # Billing block
-    element = session.find_by_id(
-        "wnd[0]/usr/tabsTAXI_TABSTRIP_OVERVIEW/tabpT\\01/ssubSUBSCREEN_BODY:SAPMV45A:4400/ssubHEADER_FRAME:SAPMV45A:4440/cmbVBAK-FAKSK"
-    )
+    element = va01_overview.find_by_id(BILLING_BLOCK_ID)
     element.text = "Calculation Missing"
     assert element.type == "GuiComboBox"
 
-    # Refresh element
-    element = session.find_by_id(
-        "wnd[0]/usr/tabsTAXI_TABSTRIP_OVERVIEW/tabpT\\01/ssubSUBSCREEN_BODY:SAPMV45A:4400/ssubHEADER_FRAME:SAPMV45A:4440/cmbVBAK-FAKSK"
-    )
+    # Find the element again to read the value back from SAP (the session does not cache)
+    element = va01_overview.find_by_id(BILLING_BLOCK_ID)
     assert element.text == "Calculation Missing"
     assert element.type == "GuiComboBox"
 
 
-def test_click_tab(session: GuiSession):
+def test_click_tab(va01_overview: GuiSession, today_ddmmyyyy: str):
     # Set PO date
-    session.find_by_id(
-        "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/ctxtVBKD-BSTDK"
-    ).text = date.today().strftime("%d.%m.%Y")
+    va01_overview.find_by_id(PO_DATE_ID).text = today_ddmmyyyy
 
     # Set PO number
-    session.find_by_id(
-        "wnd[0]/usr/subSUBSCREEN_HEADER:SAPMV45A:4021/txtVBKD-BSTKD"
-    ).text = "PO123456"
+    va01_overview.find_by_id(PO_NUMBER_ID).text = "PO123456"
 
     # Click Item Overview Tab
-    assert (
-        session.find_by_id("wnd[0]/usr/tabsTAXI_TABSTRIP_OVERVIEW/tabpT\\02").click()
-        is True
-    )
+    assert va01_overview.find_by_id(ITEM_OVERVIEW_TAB_ID).click() is True
 
 
 def test_click_radio_button(session: GuiSession):
@@ -104,12 +85,8 @@ def test_click_checkbox(session: GuiSession):
     session.press_enter()
 
     # Click Checkbox
-    session.find_by_id(
-        "wnd[0]/usr/tblSAPLSE16NSELFIELDS_TC/chkGS_SELFIELDS-MARK[5,1]"
-    ).click()
+    session.find_by_id(SE16N_MARK_CHECKBOX_ID).click()
 
-    checkbox = session.find_by_id(
-        "wnd[0]/usr/tblSAPLSE16NSELFIELDS_TC/chkGS_SELFIELDS-MARK[5,1]"
-    ).get_checkbox_state()
+    checkbox = session.find_by_id(SE16N_MARK_CHECKBOX_ID).get_checkbox_state()
 
     assert checkbox is True